@@ -0,0 +1,17 @@
+"""
+Build the optional Cython kernel used by test_black_scholes.py.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="bs-reference-kernels",
+    ext_modules=cythonize(
+        [Extension("_bs_cy", ["_bs_cy.pyx"])],
+        language_level=3,
+    ),
+)
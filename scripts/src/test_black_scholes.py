@@ -1,52 +1,249 @@
 #!/usr/bin/env python3
 """
-Black-Scholes Reference Tests using scipy.
+Black-Scholes Reference Tests.
 
 This script generates reference values for testing the Move implementation
-against the industry-standard Black-Scholes formulas in scipy.
+against the industry-standard Black-Scholes formulas. Scalar pricing
+evaluates the normal CDF with the standard library's erfc, which matches
+scipy.stats.norm to machine precision; scipy.special.ndtr is imported
+only when arrays are priced on the NumPy path.
 
 Usage:
-    python test_black_scholes.py
+    python test_black_scholes.py [--verbose]
+
+The assertions checking these values live in test_reference.py (run with
+pytest).
 
 All values use WAD scaling (10^18) to match the Move implementation.
 """
 
+import argparse
+import math
+import sys
+from decimal import Decimal
+
 import numpy as np
-from scipy.stats import norm
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from typing import List, Optional, Tuple, Union
+
+try:
+    import numba
+except ImportError:  # numba is optional; only black_scholes_numba needs it
+    numba = None
+
+try:
+    import _bs_cy
+except ImportError:  # optional; build with `python setup.py build_ext --inplace`
+    _bs_cy = None
 
 # WAD scale factor: 10^18
 WAD = 10**18
 
+# Largest float magnitude whose WAD scaling fits in int64, (2^63 - 1) / 10^18
+_I64_WAD_LIMIT = np.iinfo(np.int64).max / WAD
+
+# 1 / sqrt(2), for Φ(x) = erfc(-x / sqrt(2)) / 2
+_SQRT1_2 = 1.0 / math.sqrt(2.0)
+
+# Section divider for console output
+_RULE = "=" * 60
+
+# One Move test-vector block; a trailing newline leaves a blank line between blocks
+_MOVE_VECTOR_TMPL = (
+    "// %s: S=%s, K=%s, T=%s, r=%s%%, σ=%s%%\n"
+    "// Call = %.6f, Put = %.6f\n"
+    "let spot = %d * SCALE;\n"
+    "let strike = %d * SCALE;\n"
+    "let time = %d; // %s\n"
+    "let rate = %d; // %s%%\n"
+    "let vol = %d; // %s%%\n"
+    "// Expected call: %d\n"
+    "// Expected put:  %d\n"
+)
+
+# Standard normal PDF normalisation: 1 / sqrt(2π)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _ndtr(x: float) -> float:
+    """Standard normal CDF; erfc keeps full precision in the lower tail."""
+    return 0.5 * math.erfc(-x * _SQRT1_2)
+
+
+@lru_cache(maxsize=None)
+def _array_ndtr():
+    """
+    Elementwise normal CDF for the NumPy path.
+    
+    scipy.special.ndtr is imported on first use so scalar callers never pay
+    for scipy. Without scipy this falls back to a per-element loop over
+    _ndtr, which is correct but much slower on large arrays.
+    """
+    try:
+        from scipy.special import ndtr
+    except ImportError:
+        return np.vectorize(_ndtr, otypes=[np.float64])
+    return ndtr
+
 
-@dataclass
 class BlackScholesResult:
-    """Black-Scholes calculation results."""
-    d1: float
-    d2: float
-    call_price: float
-    put_price: float
-    delta_call: float
-    delta_put: float
-    gamma: float
-    vega: float
-    theta_call: float
-    theta_put: float
-    rho_call: float
-    rho_put: float
+    """
+    Black-Scholes calculation results.
+    
+    Only d1 and d2 are computed up front. Prices and Greeks are evaluated
+    on first access and cached, so callers pay only for what they read.
+    
+    Instances are immutable: the scalar pricer memoises them and hands the
+    same object to every caller.
+    """
+    
+    def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
+        # One reciprocal serves d1, gamma and theta
+        sqrtT = math.sqrt(T)
+        sigma2_half = 0.5 * sigma * sigma
+        sig_sqrtT = sigma * sqrtT
+        inv_sig_sqrtT = 1.0 / sig_sqrtT
+        d1 = (math.log(S / K) + (r + sigma2_half) * T) * inv_sig_sqrtT
+        
+        # Bypass __setattr__; cached_property also writes straight to __dict__
+        self.__dict__.update(
+            S=S, K=K, T=T, r=r, sigma=sigma,
+            d1=d1, d2=d1 - sig_sqrtT,
+            _sqrtT=sqrtT, _sigma2_half=sigma2_half, _inv_sig_sqrtT=inv_sig_sqrtT,
+        )
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __repr__(self) -> str:
+        return (
+            f"BlackScholesResult(S={self.S}, K={self.K}, T={self.T}, "
+            f"r={self.r}, sigma={self.sigma})"
+        )
+    
+    # Shared intermediates; N(-x) gets its own erfc call, since 1 - N(x)
+    # cancels to noise for deep in-the-money puts
+    
+    @cached_property
+    def _discK(self) -> float:
+        return self.K * math.exp(-self.r * self.T)
+    
+    @cached_property
+    def _Nd1(self) -> float:
+        return _ndtr(self.d1)
+    
+    @cached_property
+    def _Nd2(self) -> float:
+        return _ndtr(self.d2)
+    
+    @cached_property
+    def _Nmd1(self) -> float:
+        return _ndtr(-self.d1)
+    
+    @cached_property
+    def _Nmd2(self) -> float:
+        return _ndtr(-self.d2)
+    
+    @cached_property
+    def _pdf_d1(self) -> float:
+        return math.exp(-0.5 * self.d1 * self.d1) * _INV_SQRT_2PI
+    
+    @cached_property
+    def _decay(self) -> float:
+        # S * pdf(d1) * sigma / (2 * sqrt(T)), with sigma / (2 * sqrt(T))
+        # rewritten as (sigma^2 / 2) / (sigma * sqrt(T))
+        return self.S * self._pdf_d1 * self._sigma2_half * self._inv_sig_sqrtT
+    
+    # Option prices
+    
+    @cached_property
+    def call_price(self) -> float:
+        return self.S * self._Nd1 - self._discK * self._Nd2
+    
+    @cached_property
+    def put_price(self) -> float:
+        return self._discK * self._Nmd2 - self.S * self._Nmd1
+    
+    # Greeks
+    
+    @cached_property
+    def delta_call(self) -> float:
+        return self._Nd1
+    
+    @cached_property
+    def delta_put(self) -> float:
+        return -self._Nmd1
+    
+    @cached_property
+    def gamma(self) -> float:
+        return self._pdf_d1 * self._inv_sig_sqrtT / self.S
+    
+    @cached_property
+    def vega(self) -> float:
+        return self.S * self._pdf_d1 * self._sqrtT
+    
+    @cached_property
+    def theta_call(self) -> float:
+        return -self._decay - self.r * self._discK * self._Nd2
+    
+    @cached_property
+    def theta_put(self) -> float:
+        return -self._decay + self.r * self._discK * self._Nmd2
+    
+    @cached_property
+    def rho_call(self) -> float:
+        return self.T * self._discK * self._Nd2
+    
+    @cached_property
+    def rho_put(self) -> float:
+        return -self.T * self._discK * self._Nmd2
+
+
+@dataclass
+class BlackScholesBatch:
+    """
+    Black-Scholes results for many scenarios, stored column-wise.
+    
+    Each field is an array with one entry per scenario, so downstream code
+    slices contiguous columns (e.g. ``batch.call_price[i]``).
+    """
+    d1: np.ndarray
+    d2: np.ndarray
+    call_price: np.ndarray
+    put_price: np.ndarray
+    delta_call: np.ndarray
+    delta_put: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta_call: np.ndarray
+    theta_put: np.ndarray
+    rho_call: np.ndarray
+    rho_put: np.ndarray
+    
+    def __getitem__(self, index) -> "BlackScholesBatch":
+        """Select scenarios from every column; an integer index gives scalar fields."""
+        return BlackScholesBatch(*(getattr(self, f.name)[index] for f in fields(self)))
 
 
 def black_scholes(
-    S: float,
-    K: float,
-    T: float,
-    r: float,
-    sigma: float
-) -> BlackScholesResult:
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    r: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray]
+) -> Union[BlackScholesResult, BlackScholesBatch]:
     """
     Calculate Black-Scholes option pricing and Greeks.
     
+    Inputs may be scalars or equal-length arrays. Array inputs are priced
+    by the compiled Cython kernel when it has been built, otherwise by
+    NumPy ufuncs with scipy.special.ndtr for the normal CDF (a per-element
+    fallback is used if scipy is not installed).
+    
     Args:
         S: Spot price
         K: Strike price
@@ -55,54 +252,253 @@ def black_scholes(
         sigma: Volatility
         
     Returns:
-        BlackScholesResult with all values
+        BlackScholesResult for scalar inputs, BlackScholesBatch otherwise
+    
+    Raises:
+        ValueError: If any S, K, T or sigma is not strictly positive
     """
+    if all(np.ndim(x) == 0 for x in (S, K, T, r, sigma)):
+        # float() makes 0-d arrays and NumPy scalars hashable for the cache
+        return _black_scholes_scalar(*(float(x) for x in (S, K, T, r, sigma)))
+    S, K, T, r, sigma = _as_columns(S, K, T, r, sigma)
+    _check_domain(S, K, T, sigma)
+    if _bs_cy is not None and S.ndim == 1:
+        return _black_scholes_cython(S, K, T, r, sigma)
+    return _black_scholes_batch(S, K, T, r, sigma)
+
+
+def _as_columns(*args) -> Tuple[np.ndarray, ...]:
+    """Broadcast inputs to contiguous float64 arrays of a common shape."""
+    return tuple(
+        np.ascontiguousarray(x) for x in np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in args)
+        )
+    )
+
+
+def _check_domain(S, K, T, sigma) -> None:
+    """Reject inputs where log(S / K) or 1 / (sigma * sqrt(T)) is undefined."""
+    if not (np.all(S > 0) and np.all(K > 0) and np.all(T > 0) and np.all(sigma > 0)):
+        raise ValueError("S, K, T and sigma must all be positive")
+
+
+def _empty_batch(shape: Tuple[int, ...]) -> BlackScholesBatch:
+    """Allocate uninitialised result columns."""
+    return BlackScholesBatch(*(np.empty(shape) for _ in fields(BlackScholesBatch)))
+
+
+@lru_cache(maxsize=None)
+def _black_scholes_scalar(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float
+) -> BlackScholesResult:
+    """Price a single scenario; results are memoised per input tuple."""
+    _check_domain(S, K, T, sigma)
+    return BlackScholesResult(S, K, T, r, sigma)
+
+
+def _black_scholes_cython(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray
+) -> BlackScholesBatch:
+    """Price 1-D scenario columns with the compiled _bs_cy kernel."""
+    out = _empty_batch(S.shape)
+    _bs_cy.bs_batch(S, K, T, r, sigma, *(getattr(out, f.name) for f in fields(out)))
+    return out
+
+
+def _black_scholes_batch(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray
+) -> BlackScholesBatch:
+    """Price many scenarios at once, writing into preallocated columns."""
+    out = _empty_batch(S.shape)
+    
+    # Shared subexpressions
+    sqrtT = np.sqrt(T)
+    sigma2_half = 0.5 * sigma * sigma
+    sig_sqrtT = sigma * sqrtT
+    inv_sig_sqrtT = 1.0 / sig_sqrtT
+    discK = np.exp(-r * T)
+    discK *= K
+    
     # d1 and d2
-    d1 = (np.log(S / K) + (r + sigma**2 / 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    np.log(S / K, out=out.d1)
+    out.d1 += (r + sigma2_half) * T
+    out.d1 *= inv_sig_sqrtT
+    np.subtract(out.d1, sig_sqrtT, out=out.d2)
+    
+    # N(d1), N(d2), N(-d1), N(-d2); the tails are evaluated directly rather
+    # than as 1 - N(x), which cancels for deep in-the-money puts
+    ndtr = _array_ndtr()
+    out.delta_call[...] = ndtr(out.d1)
+    Nd1 = out.delta_call
+    Nd2 = ndtr(out.d2)
+    Nmd1 = ndtr(-out.d1)
+    Nmd2 = ndtr(-out.d2)
+    pdf_d1 = np.exp(-0.5 * out.d1 * out.d1)
+    pdf_d1 *= _INV_SQRT_2PI
     
     # Option prices
-    call = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-    put = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+    np.multiply(S, Nd1, out=out.call_price)
+    out.call_price -= discK * Nd2
+    np.multiply(discK, Nmd2, out=out.put_price)
+    out.put_price -= S * Nmd1
     
     # Greeks
-    delta_call = norm.cdf(d1)
-    delta_put = norm.cdf(d1) - 1
+    np.negative(Nmd1, out=out.delta_put)
+    
+    np.multiply(pdf_d1, inv_sig_sqrtT, out=out.gamma)
+    out.gamma /= S
+    np.multiply(S * pdf_d1, sqrtT, out=out.vega)
+    
+    decay = S * pdf_d1 * sigma2_half * inv_sig_sqrtT
+    np.multiply(r * discK, Nd2, out=out.theta_call)
+    np.negative(out.theta_call, out=out.theta_call)
+    out.theta_call -= decay
+    np.multiply(r * discK, Nmd2, out=out.theta_put)
+    out.theta_put -= decay
+    
+    np.multiply(T * discK, Nd2, out=out.rho_call)
+    np.multiply(T * discK, Nmd2, out=out.rho_put)
+    np.negative(out.rho_put, out=out.rho_put)
+    
+    return out
+
+
+if numba is not None:
+    # Abramowitz & Stegun 7.1.26 coefficients (|error| < 1.5e-7). Hand-coded
+    # because scipy.special.erf/ndtr cannot be called from nopython code.
+    _AS_P = 0.3275911
+    _AS_A1 = 0.254829592
+    _AS_A2 = -0.284496736
+    _AS_A3 = 1.421413741
+    _AS_A4 = -1.453152027
+    _AS_A5 = 1.061405429
+
+    @numba.njit(fastmath=True, cache=True)
+    def _phi(x):
+        """Standard normal CDF via the A&S 7.1.26 erf approximation."""
+        z = abs(x) * _SQRT1_2
+        t = 1.0 / (1.0 + _AS_P * z)
+        poly = t * (_AS_A1 + t * (_AS_A2 + t * (_AS_A3 + t * (_AS_A4 + t * _AS_A5))))
+        # Lower tail 0.5 * erfc(z), kept unsubtracted so N(-x) stays precise
+        tail = 0.5 * poly * math.exp(-z * z)
+        if x < 0.0:
+            return tail
+        return 1.0 - tail
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _bs_numba(
+        S, K, T, r, sigma,
+        out_d1, out_d2, out_call, out_put, out_delta_call, out_delta_put,
+        out_gamma, out_vega, out_theta_call, out_theta_put, out_rho_call, out_rho_put,
+    ):
+        """Price every scenario in parallel, one scalar kernel per element."""
+        for i in numba.prange(len(S)):
+            sqrtT = math.sqrt(T[i])
+            sigma2_half = 0.5 * sigma[i] * sigma[i]
+            sig_sqrtT = sigma[i] * sqrtT
+            inv_sig_sqrtT = 1.0 / sig_sqrtT
+            discK = K[i] * math.exp(-r[i] * T[i])
+            
+            d1 = (math.log(S[i] / K[i]) + (r[i] + sigma2_half) * T[i]) * inv_sig_sqrtT
+            d2 = d1 - sig_sqrtT
+            
+            Nd1 = _phi(d1)
+            Nd2 = _phi(d2)
+            Nmd1 = _phi(-d1)
+            Nmd2 = _phi(-d2)
+            pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+            decay = S[i] * pdf_d1 * sigma2_half * inv_sig_sqrtT
+            
+            out_d1[i] = d1
+            out_d2[i] = d2
+            out_call[i] = S[i] * Nd1 - discK * Nd2
+            out_put[i] = discK * Nmd2 - S[i] * Nmd1
+            out_delta_call[i] = Nd1
+            out_delta_put[i] = -Nmd1
+            out_gamma[i] = pdf_d1 * inv_sig_sqrtT / S[i]
+            out_vega[i] = S[i] * pdf_d1 * sqrtT
+            out_theta_call[i] = -decay - r[i] * discK * Nd2
+            out_theta_put[i] = -decay + r[i] * discK * Nmd2
+            out_rho_call[i] = T[i] * discK * Nd2
+            out_rho_put[i] = -T[i] * discK * Nmd2
+
+
+def black_scholes_numba(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray
+) -> BlackScholesBatch:
+    """
+    Price large scenario arrays with the Numba-compiled parallel kernel.
     
-    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega = S * norm.pdf(d1) * np.sqrt(T)
+    The normal CDF uses the A&S 7.1.26 approximation, so results agree with
+    black_scholes to roughly 1e-7 in probability terms rather than to
+    machine precision. Use black_scholes for reference values.
     
-    theta_call = (
-        -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-        - r * K * np.exp(-r * T) * norm.cdf(d2)
-    )
-    theta_put = (
-        -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-        + r * K * np.exp(-r * T) * norm.cdf(-d2)
-    )
-    
-    rho_call = K * T * np.exp(-r * T) * norm.cdf(d2)
-    rho_put = -K * T * np.exp(-r * T) * norm.cdf(-d2)
-    
-    return BlackScholesResult(
-        d1=d1,
-        d2=d2,
-        call_price=call,
-        put_price=put,
-        delta_call=delta_call,
-        delta_put=delta_put,
-        gamma=gamma,
-        vega=vega,
-        theta_call=theta_call,
-        theta_put=theta_put,
-        rho_call=rho_call,
-        rho_put=rho_put,
+    Raises:
+        ImportError: If numba is not installed
+        ValueError: If any S, K, T or sigma is not strictly positive
+    """
+    if numba is None:
+        raise ImportError("black_scholes_numba requires numba")
+    S, K, T, r, sigma = _as_columns(S, K, T, r, sigma)
+    _check_domain(S, K, T, sigma)
+    # The kernel indexes 1-D columns; contiguous ravels and reshapes are views
+    out = _empty_batch((S.size,))
+    _bs_numba(
+        S.ravel(), K.ravel(), T.ravel(), r.ravel(), sigma.ravel(),
+        *(getattr(out, f.name) for f in fields(out)),
     )
+    return BlackScholesBatch(*(getattr(out, f.name).reshape(S.shape) for f in fields(out)))
 
 
 def to_wad(value: float) -> int:
-    """Convert float to WAD-scaled integer."""
-    return int(value * WAD)
+    """
+    Convert float to WAD-scaled integer.
+    
+    Scales in the decimal domain from the shortest repr of the float, since
+    value * 10^18 exceeds float64's 53-bit mantissa and would corrupt the
+    low-order digits.
+    """
+    return int(Decimal(repr(float(value))) * WAD)
+
+
+def to_wad_i64_arr(values: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of floats to WAD-scaled int64 values.
+    
+    A plain helper over to_wad: every element goes through to_wad, so
+    array and scalar conversions agree digit for digit, and the cost is
+    the same as converting element by element. Float-domain shortcuts
+    (value * 10^18, or a split into 10^9 halves) round before the
+    integer step and reintroduce low-order noise. The finiteness and
+    range checks run once over the whole array, before any conversion.
+    
+    Raises:
+        ValueError: If any value is NaN or infinite
+        OverflowError: If any |value| * 10^18 does not fit in int64
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not np.all(np.isfinite(values)):
+        raise ValueError("cannot WAD-scale NaN or infinite values")
+    if not np.all(np.abs(values) < _I64_WAD_LIMIT):
+        raise OverflowError(f"WAD-scaled values exceed int64 (|value| >= {_I64_WAD_LIMIT})")
+    scaled = [to_wad(v) for v in values.ravel().tolist()]
+    return np.array(scaled, dtype=np.int64).reshape(values.shape)
 
 
 def from_wad(value: int) -> float:
@@ -110,133 +506,241 @@ def from_wad(value: int) -> float:
     return value / WAD
 
 
-def test_atm_option():
-    """Test ATM option: S = K = 100, T = 1, r = 5%, σ = 20%."""
-    print("=" * 60)
-    print("TEST: ATM Option (S=100, K=100, T=1, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=100, K=100, T=1, r=0.05, sigma=0.2)
-    
-    print(f"\nd1 = {result.d1:.10f}")
-    print(f"d2 = {result.d2:.10f}")
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Put Price  = {result.put_price:.10f}")
-    print(f"\nPut-Call Parity Check:")
-    print(f"  C - P = {result.call_price - result.put_price:.10f}")
-    print(f"  S - K*e^(-rT) = {100 - 100 * np.exp(-0.05):.10f}")
-    
-    print(f"\nGreeks:")
-    print(f"  Delta (call) = {result.delta_call:.10f}")
-    print(f"  Delta (put)  = {result.delta_put:.10f}")
-    print(f"  Gamma        = {result.gamma:.10f}")
-    print(f"  Vega         = {result.vega:.10f}")
-    print(f"  Theta (call) = {result.theta_call:.10f}")
-    print(f"  Theta (put)  = {result.theta_put:.10f}")
-    print(f"  Rho (call)   = {result.rho_call:.10f}")
-    print(f"  Rho (put)    = {result.rho_put:.10f}")
-    
-    print(f"\nWAD-scaled values for Move tests:")
-    print(f"  d1 = {to_wad(result.d1)}")
-    print(f"  d2 = {to_wad(result.d2)}")
-    print(f"  Call = {to_wad(result.call_price)}")
-    print(f"  Put  = {to_wad(result.put_price)}")
-    print(f"  Delta (call) = {to_wad(result.delta_call)}")
-    print(f"  Gamma = {to_wad(result.gamma)}")
-    print(f"  Vega = {to_wad(result.vega)}")
+# === Shared scenario grid ===
+
+# Every scenario the script prices: (id, description, S, K, T, r, sigma)
+SCENARIOS = [
+    ("atm", "ATM standard", 100, 100, 1.0, 0.05, 0.2),
+    ("itm", "ITM call", 120, 100, 1.0, 0.05, 0.2),
+    ("otm", "OTM call", 80, 100, 1.0, 0.05, 0.2),
+    ("deep_itm", "Deep ITM call", 200, 100, 1.0, 0.05, 0.2),
+    ("deep_otm", "Deep OTM call", 50, 100, 1.0, 0.05, 0.2),
+    ("short_expiry", "Short expiry", 100, 100, 0.25, 0.05, 0.2),
+    ("vol_40", "Higher vol", 100, 100, 1.0, 0.05, 0.4),
+    ("vol_50", "High volatility", 100, 100, 1.0, 0.05, 0.5),
+    ("high_rate", "Higher rate", 100, 100, 1.0, 0.10, 0.2),
+    ("high_rate_vol", "Higher rate and vol", 100, 100, 1.0, 0.10, 0.3),
+]
+_SCENARIO_INDEX = {case[0]: i for i, case in enumerate(SCENARIOS)}
+
+# Expected (call, put) hardcoded in sources/reference_tests.move; these
+# scenarios are also the ones emitted as Move test vectors
+MOVE_EXPECTED_PRICES = {
+    "atm": (10.4506, 5.5735),
+    "itm": (26.17, 1.29),
+    "otm": (1.86, 16.98),
+    "short_expiry": (4.61, 3.37),
+    "vol_40": (18.02, 13.15),
+    "high_rate": (13.27, 3.75),
+}
+
+_S, _K, _T, _r, _sig = (
+    np.array(col, dtype=np.float64) for col in list(zip(*SCENARIOS))[2:]
+)
+for _col in (_S, _K, _T, _r, _sig):
+    _col.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
+def _reference_batch() -> BlackScholesBatch:
+    """
+    The whole grid, priced once on first use.
     
-    return result
+    Reports, parity checks, vectors and tests all index into this batch.
+    Deferring it keeps module import free of array pricing (and scipy).
+    Every column is read-only, since all callers share the cached arrays.
+    """
+    batch = black_scholes(_S, _K, _T, _r, _sig)
+    for f in fields(batch):
+        getattr(batch, f.name).flags.writeable = False
+    return batch
 
 
-def test_itm_call():
-    """Test ITM call: S = 120, K = 100."""
-    print("\n" + "=" * 60)
-    print("TEST: ITM Call (S=120, K=100, T=1, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=120, K=100, T=1, r=0.05, sigma=0.2)
+def _reference(name: str) -> BlackScholesBatch:
+    """Reference results for one named scenario, with scalar fields."""
+    return _reference_batch()[_SCENARIO_INDEX[name]]
+
+
+def _emit(lines: List[str]) -> None:
+    """Write a block of output lines with a single stdout call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _scenario(name: str) -> tuple:
+    """Grid row (id, description, S, K, T, r, sigma) for a named scenario."""
+    return SCENARIOS[_SCENARIO_INDEX[name]]
+
+
+def _section(name: str) -> str:
+    """Banner that opens a scenario report, built from its grid row."""
+    _, desc, S, K, T, r, sigma = _scenario(name)
+    return "\n%s\nTEST: %s (S=%s, K=%s, T=%g, r=%g%%, σ=%g%%)\n%s\n" % (
+        _RULE, desc, S, K, T, r * 100, sigma * 100, _RULE,
+    )
+
+
+_ATM_TMPL = """
+d1 = %.10f
+d2 = %.10f
+
+Call Price = %.10f
+Put Price  = %.10f
+
+Put-Call Parity Check:
+  C - P = %.10f
+  S - K*e^(-rT) = %.10f
+
+Greeks:
+  Delta (call) = %.10f
+  Delta (put)  = %.10f
+  Gamma        = %.10f
+  Vega         = %.10f
+  Theta (call) = %.10f
+  Theta (put)  = %.10f
+  Rho (call)   = %.10f
+  Rho (put)    = %.10f
+
+WAD-scaled values for Move tests:
+  d1 = %d
+  d2 = %d
+  Call = %d
+  Put  = %d
+  Delta (call) = %d
+  Gamma = %d
+  Vega = %d
+"""
+
+
+def report_atm_option():
+    """Report the ATM scenario with every Greek and its WAD values."""
+    _, _, S, K, T, r, _ = _scenario("atm")
+    result = _reference("atm")
     
-    print(f"\nd1 = {result.d1:.10f}")
-    print(f"d2 = {result.d2:.10f}")
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Put Price  = {result.put_price:.10f}")
-    print(f"Intrinsic Value = {max(120 - 100, 0)}")
-    print(f"Time Value = {result.call_price - max(120 - 100, 0):.10f}")
+    sys.stdout.write(_section("atm") + _ATM_TMPL % (
+        result.d1, result.d2,
+        result.call_price, result.put_price,
+        result.call_price - result.put_price, S - K * math.exp(-r * T),
+        result.delta_call, result.delta_put, result.gamma, result.vega,
+        result.theta_call, result.theta_put, result.rho_call, result.rho_put,
+        to_wad(result.d1), to_wad(result.d2), to_wad(result.call_price), to_wad(result.put_price),
+        to_wad(result.delta_call), to_wad(result.gamma), to_wad(result.vega),
+    ))
     
     return result
 
 
-def test_otm_call():
-    """Test OTM call: S = 80, K = 100."""
-    print("\n" + "=" * 60)
-    print("TEST: OTM Call (S=80, K=100, T=1, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=80, K=100, T=1, r=0.05, sigma=0.2)
+_ITM_TMPL = """
+d1 = %.10f
+d2 = %.10f
+
+Call Price = %.10f
+Put Price  = %.10f
+Intrinsic Value = %s
+Time Value = %.10f
+"""
+
+
+def report_itm_call():
+    """Report the ITM call scenario with its intrinsic and time value."""
+    _, _, S, K, _, _, _ = _scenario("itm")
+    result = _reference("itm")
+    intrinsic = max(S - K, 0)
     
-    print(f"\nd1 = {result.d1:.10f}")
-    print(f"d2 = {result.d2:.10f}")
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Put Price  = {result.put_price:.10f}")
+    sys.stdout.write(_section("itm") + _ITM_TMPL % (
+        result.d1, result.d2,
+        result.call_price, result.put_price,
+        intrinsic, result.call_price - intrinsic,
+    ))
     
     return result
 
 
-def test_deep_itm():
-    """Test deep ITM call: S = 200, K = 100."""
-    print("\n" + "=" * 60)
-    print("TEST: Deep ITM Call (S=200, K=100, T=1, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=200, K=100, T=1, r=0.05, sigma=0.2)
+_OTM_TMPL = """
+d1 = %.10f
+d2 = %.10f
+
+Call Price = %.10f
+Put Price  = %.10f
+"""
+
+
+def report_otm_call():
+    """Report the OTM call scenario."""
+    result = _reference("otm")
     
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Forward Diff = {200 - 100 * np.exp(-0.05):.10f}")
-    print(f"Delta (call) = {result.delta_call:.10f} (should be ~1)")
+    sys.stdout.write(_section("otm") + _OTM_TMPL % (
+        result.d1, result.d2, result.call_price, result.put_price,
+    ))
     
     return result
 
 
-def test_deep_otm():
-    """Test deep OTM call: S = 50, K = 100."""
-    print("\n" + "=" * 60)
-    print("TEST: Deep OTM Call (S=50, K=100, T=1, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=50, K=100, T=1, r=0.05, sigma=0.2)
+_DEEP_ITM_TMPL = """
+Call Price = %.10f
+Forward Diff = %.10f
+Delta (call) = %.10f (should be ~1)
+"""
+
+
+def report_deep_itm():
+    """Report the deep ITM call scenario against its forward value."""
+    _, _, S, K, T, r, _ = _scenario("deep_itm")
+    result = _reference("deep_itm")
     
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Delta (call) = {result.delta_call:.10f} (should be ~0)")
+    sys.stdout.write(_section("deep_itm") + _DEEP_ITM_TMPL % (
+        result.call_price, S - K * math.exp(-r * T), result.delta_call,
+    ))
     
     return result
 
 
-def test_short_expiry():
-    """Test short expiry: T = 0.25 (3 months)."""
-    print("\n" + "=" * 60)
-    print("TEST: Short Expiry (S=100, K=100, T=0.25, r=5%, σ=20%)")
-    print("=" * 60)
-    
-    result = black_scholes(S=100, K=100, T=0.25, r=0.05, sigma=0.2)
+_DEEP_OTM_TMPL = """
+Call Price = %.10f
+Delta (call) = %.10f (should be ~0)
+"""
+
+
+def report_deep_otm():
+    """Report the deep OTM call scenario."""
+    result = _reference("deep_otm")
     
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Put Price  = {result.put_price:.10f}")
-    print(f"Theta (call) = {result.theta_call:.10f} (should be more negative)")
+    sys.stdout.write(_section("deep_otm") + _DEEP_OTM_TMPL % (result.call_price, result.delta_call))
     
     return result
 
 
-def test_high_volatility():
-    """Test high volatility: σ = 50%."""
-    print("\n" + "=" * 60)
-    print("TEST: High Volatility (S=100, K=100, T=1, r=5%, σ=50%)")
-    print("=" * 60)
+_SHORT_EXPIRY_TMPL = """
+Call Price = %.10f
+Put Price  = %.10f
+Theta (call) = %.10f (should be more negative)
+"""
+
+
+def report_short_expiry():
+    """Report the short-expiry scenario."""
+    result = _reference("short_expiry")
     
-    result = black_scholes(S=100, K=100, T=1, r=0.05, sigma=0.5)
+    sys.stdout.write(_section("short_expiry") + _SHORT_EXPIRY_TMPL % (
+        result.call_price, result.put_price, result.theta_call,
+    ))
     
-    print(f"\nCall Price = {result.call_price:.10f}")
-    print(f"Put Price  = {result.put_price:.10f}")
-    print(f"Vega = {result.vega:.10f} (should be higher)")
+    return result
+
+
+_HIGH_VOL_TMPL = """
+Call Price = %.10f
+Put Price  = %.10f
+Vega = %.10f (should be higher)
+"""
+
+
+def report_high_volatility():
+    """Report the 50% volatility scenario."""
+    result = _reference("vol_50")
+    
+    sys.stdout.write(_section("vol_50") + _HIGH_VOL_TMPL % (
+        result.call_price, result.put_price, result.vega,
+    ))
     
     return result
 
@@ -246,7 +750,7 @@ def verify_put_call_parity(S: float, K: float, T: float, r: float, sigma: float)
     result = black_scholes(S, K, T, r, sigma)
     
     lhs = result.call_price - result.put_price
-    rhs = S - K * np.exp(-r * T)
+    rhs = S - K * math.exp(-r * T)
     
     diff = abs(lhs - rhs)
     tolerance = 1e-10
@@ -254,81 +758,103 @@ def verify_put_call_parity(S: float, K: float, T: float, r: float, sigma: float)
     return diff < tolerance
 
 
+def verify_put_call_parity_batch(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray
+) -> np.ndarray:
+    """Verify put-call parity for every scenario; returns a boolean mask."""
+    S, K, T, r, sigma = _as_columns(S, K, T, r, sigma)
+    return _parity_mask(black_scholes(S, K, T, r, sigma), S, K, T, r)
+
+
+def _parity_mask(
+    batch: BlackScholesBatch,
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray
+) -> np.ndarray:
+    """Elementwise C - P = S - K*e^(-rT) check on already-priced scenarios."""
+    return np.abs(batch.call_price - batch.put_price - (S - K * np.exp(-r * T))) < 1e-10
+
+
 def generate_move_test_vectors():
     """Generate test vectors for Move unit tests."""
-    print("\n" + "=" * 60)
-    print("MOVE TEST VECTORS")
-    print("=" * 60)
-    
-    test_cases = [
-        # (S, K, T, r, sigma, description)
-        (100, 100, 1.0, 0.05, 0.2, "ATM standard"),
-        (120, 100, 1.0, 0.05, 0.2, "ITM call"),
-        (80, 100, 1.0, 0.05, 0.2, "OTM call"),
-        (100, 100, 0.25, 0.05, 0.2, "Short expiry"),
-        (100, 100, 1.0, 0.05, 0.4, "Higher vol"),
-        (100, 100, 1.0, 0.10, 0.2, "Higher rate"),
+    idx = np.array([_SCENARIO_INDEX[name] for name in MOVE_EXPECTED_PRICES])
+    cases = [SCENARIOS[i] for i in idx]
+    batch = _reference_batch()[idx]
+    
+    # Input columns fit in int64 once scaled; prices may not (26 * WAD > 2^63)
+    T_wad = to_wad_i64_arr(_T[idx])
+    r_wad = to_wad_i64_arr(_r[idx])
+    sigma_wad = to_wad_i64_arr(_sig[idx])
+    
+    lines = [
+        "\n" + _RULE,
+        "MOVE TEST VECTORS",
+        _RULE,
+        "\nconst SCALE: u256 = 1_000_000_000_000_000_000;\n",
     ]
-    
-    print("\nconst SCALE: u256 = 1_000_000_000_000_000_000;\n")
-    
-    for S, K, T, r, sigma, desc in test_cases:
-        result = black_scholes(S, K, T, r, sigma)
-        
-        print(f"// {desc}: S={S}, K={K}, T={T}, r={r*100}%, σ={sigma*100}%")
-        print(f"// Call = {result.call_price:.6f}, Put = {result.put_price:.6f}")
-        print(f"let spot = {int(S)} * SCALE;")
-        print(f"let strike = {int(K)} * SCALE;")
-        print(f"let time = {to_wad(T)}; // {T}")
-        print(f"let rate = {to_wad(r)}; // {r*100}%")
-        print(f"let vol = {to_wad(sigma)}; // {sigma*100}%")
-        print(f"// Expected call: {to_wad(result.call_price)}")
-        print(f"// Expected put:  {to_wad(result.put_price)}")
-        print()
-
-
-def main():
-    """Run all tests."""
-    print("Black-Scholes Reference Implementation")
-    print("Using scipy.stats.norm for CDF/PDF calculations")
-    print()
-    
-    # Run test cases
-    test_atm_option()
-    test_itm_call()
-    test_otm_call()
-    test_deep_itm()
-    test_deep_otm()
-    test_short_expiry()
-    test_high_volatility()
+    rows = zip(cases, batch.call_price, batch.put_price, T_wad, r_wad, sigma_wad)
+    for (_, desc, S, K, T, r, sigma), call_price, put_price, time, rate, vol in rows:
+        r_pct = r * 100
+        sigma_pct = sigma * 100
+        lines.append(_MOVE_VECTOR_TMPL % (
+            desc, S, K, T, r_pct, sigma_pct,
+            call_price, put_price, S, K,
+            time, T, rate, r_pct, vol, sigma_pct,
+            to_wad(call_price), to_wad(put_price),
+        ))
+    _emit(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Print parity checks and Move test vectors (plus per-scenario reports with -v)."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="also print the detailed per-scenario reports",
+    )
+    args = parser.parse_args(argv)
+    
+    _emit([
+        "Black-Scholes Reference Implementation",
+        "Using math.erfc for CDF calculations",
+        "",
+    ])
+    
+    if args.verbose:
+        report_atm_option()
+        report_itm_call()
+        report_otm_call()
+        report_deep_itm()
+        report_deep_otm()
+        report_short_expiry()
+        report_high_volatility()
     
     # Verify put-call parity for various cases
-    print("\n" + "=" * 60)
-    print("PUT-CALL PARITY VERIFICATION")
-    print("=" * 60)
-    
-    test_cases = [
-        (100, 100, 1, 0.05, 0.2),
-        (120, 100, 1, 0.05, 0.2),
-        (80, 100, 1, 0.05, 0.2),
-        (100, 100, 0.25, 0.05, 0.2),
-        (100, 100, 1, 0.10, 0.3),
-    ]
+    parity_ok = _parity_mask(_reference_batch(), _S, _K, _T, _r)
     
-    for S, K, T, r, sigma in test_cases:
-        parity_ok = verify_put_call_parity(S, K, T, r, sigma)
-        status = "✓" if parity_ok else "✗"
-        print(f"{status} S={S}, K={K}, T={T}, r={r}, σ={sigma}")
+    lines = ["\n" + _RULE, "PUT-CALL PARITY VERIFICATION", _RULE]
+    for (_, _, S, K, T, r, sigma), ok in zip(SCENARIOS, parity_ok):
+        status = "✓" if ok else "✗"
+        lines.append(f"{status} S={S}, K={K}, T={T}, r={r}, σ={sigma}")
+    _emit(lines)
     
     # Generate Move test vectors
     generate_move_test_vectors()
     
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print("All reference calculations completed.")
-    print("Use the WAD-scaled values above for Move unit tests.")
-    print("Tolerance for Move tests: < 0.1% for prices, < 0.5% for Greeks")
+    _emit([
+        "\n" + _RULE,
+        "SUMMARY",
+        _RULE,
+        "All reference calculations completed.",
+        "Use the WAD-scaled values above for Move unit tests.",
+        "Tolerance for Move tests: < 0.1% for prices, < 0.5% for Greeks",
+    ])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,330 @@
+"""
+pytest checks for the Black-Scholes reference generator.
+
+Every check reads from the shared reference batch in test_black_scholes.py,
+so the scenarios are priced once per run.
+"""
+
+import numpy as np
+import pytest
+from dataclasses import fields
+
+from test_black_scholes import (
+    MOVE_EXPECTED_PRICES,
+    BlackScholesBatch,
+    BlackScholesResult,
+    _K,
+    _S,
+    _SCENARIO_INDEX,
+    _I64_WAD_LIMIT,
+    _T,
+    _as_columns,
+    _black_scholes_batch,
+    _black_scholes_cython,
+    _bs_cy,
+    _r,
+    _reference,
+    _reference_batch,
+    _sig,
+    black_scholes,
+    black_scholes_numba,
+    numba,
+    to_wad,
+    to_wad_i64_arr,
+    verify_put_call_parity,
+    verify_put_call_parity_batch,
+)
+
+
+# Tolerances used by sources/reference_tests.move
+PRICE_TOLERANCE = 0.01
+GREEK_TOLERANCE = 0.05
+
+_MOVE_IDS = list(MOVE_EXPECTED_PRICES)
+
+
+# scipy.stats.norm values from the original reference implementation, in
+# BlackScholesBatch field order:
+# d1, d2, call, put, delta_call, delta_put, gamma, vega,
+# theta_call, theta_put, rho_call, rho_put
+SCIPY_REFERENCE = {
+    "atm": (
+        0.35000000000000003, 0.15000000000000002, 10.450583572185565, 5.573526022256971,
+        0.6368306511756191, -0.3631693488243809, 0.018762017345846895, 37.52403469169379,
+        -6.414027546438197, -1.657880423934626, 53.232481545376345, -41.89046090469506,
+    ),
+    "itm": (
+        1.261607783969773, 1.061607783969773, 26.169043946847296, 1.2919863969187073,
+        0.8964550230770805, -0.10354497692291953, 0.007500245963538315, 21.600708374990347,
+        -6.2303487786191525, -1.4742016561155817, 81.40555882240236, -13.717383627669058,
+    ),
+    "otm": (
+        -0.7657177565710485, -0.9657177565710484, 1.8594195728121825, 16.982362022883592,
+        0.2219221296481797, -0.7780778703518203, 0.018598225671687875, 23.805728859760478,
+        -3.1752904259281576, 1.5808566965754127, 15.894350799042194, -79.22859165102922,
+    ),
+    "deep_itm": (
+        3.815735902799726, 3.615735902799726, 104.87772423432371, 0.0006666843951132276,
+        0.9999321111667006, -6.78888332994454e-05, 6.874179772990105e-06, 0.05499343818392084,
+        -4.760934243769212, -0.004787121265642183, 95.1086979990164, -0.014244451054998029,
+    ),
+    "deep_otm": (
+        -3.1157359027997265, -3.3157359027997266, 0.0023994175533097323, 45.12534186762472,
+        0.0009174326039451515, -0.9990825673960548, 0.0003110898644849087, 0.15554493224245433,
+        -0.017728103856442825, 4.738419018647128, 0.04347221264394784, -95.07947023742746,
+    ),
+    "short_expiry": (
+        0.17500000000000002, 0.07500000000000001, 4.614997129602855, 3.372777178991008,
+        0.5694601832076737, -0.43053981679232634, 0.03928800094473793, 19.644000472368965,
+        -10.474151248505812, -5.536262246036404, 13.082755297791127, -11.60668971455591,
+    ),
+    "vol_40": (
+        0.325, -0.07500000000000001, 18.02295145021668, 13.145893900288087,
+        0.627409464153284, -0.372590535846716, 0.009460495798345486, 37.84198319338194,
+        -9.804296386931975, -5.048149264428405, 44.71799496511172, -50.404947484959685,
+    ),
+    "vol_50": (
+        0.35, -0.15000000000000002, 21.79260421286685, 16.915546662938254,
+        0.6368306511756191, -0.3631693488243809, 0.007504806938338758, 37.52403469169379,
+        -11.475531718158201, -6.719384595654631, 41.89046090469506, -53.232481545376345,
+    ),
+    "high_rate": (
+        0.6, 0.39999999999999997, 13.269676584660893, 3.753418388256833,
+        0.7257468822499265, -0.27425311775007355, 0.016661230144589985, 33.322460289179965,
+        -9.26274719295117, -0.21437301259157682, 59.30501164033175, -31.178730163264195,
+    ),
+    "high_rate_vol": (
+        0.4833333333333334, 0.1833333333333334, 16.73413358238666, 7.217875385982609,
+        0.6855704621388224, -0.31442953786117755, 0.011832071976064567, 35.496215928193706,
+        -10.506723652378614, -1.4583494720190195, 51.82291263149558, -38.660829172100364,
+    ),
+}
+
+# Absolute tolerance for the scipy comparison; rewritten formulas may only
+# differ from the originals in the last few ulps
+SCIPY_TOLERANCE = 1e-10
+
+_FIELD_INDEX = {f.name: i for i, f in enumerate(fields(BlackScholesBatch))}
+
+
+def _inputs(name: str) -> tuple:
+    """(S, K, T, r, sigma) of a named scenario as Python floats."""
+    i = _SCENARIO_INDEX[name]
+    return tuple(float(col[i]) for col in (_S, _K, _T, _r, _sig))
+
+
+def _within(actual: float, expected: float, tolerance: float) -> bool:
+    """Relative tolerance check matching the Move within_tolerance helper."""
+    return abs(actual - expected) <= expected * tolerance
+
+
+@pytest.mark.parametrize("name", _MOVE_IDS)
+def test_call_price_matches_move(name):
+    expected_call, _ = MOVE_EXPECTED_PRICES[name]
+    assert _within(_reference(name).call_price, expected_call, PRICE_TOLERANCE)
+
+
+@pytest.mark.parametrize("name", _MOVE_IDS)
+def test_put_price_matches_move(name):
+    _, expected_put = MOVE_EXPECTED_PRICES[name]
+    assert _within(_reference(name).put_price, expected_put, PRICE_TOLERANCE)
+
+
+@pytest.mark.parametrize("name", list(_SCENARIO_INDEX))
+def test_put_call_parity(name):
+    assert verify_put_call_parity(*_inputs(name))
+
+
+def test_put_call_parity_batch():
+    assert verify_put_call_parity_batch(_S, _K, _T, _r, _sig).all()
+
+
+@pytest.mark.parametrize("field, expected, tolerance", [
+    ("d1", 0.35, 0.02),
+    ("d2", 0.15, 0.02),
+    ("delta_call", 0.6368, GREEK_TOLERANCE),
+    ("gamma", 0.0188, GREEK_TOLERANCE),
+    ("vega", 37.52, GREEK_TOLERANCE),
+])
+def test_atm_greeks_match_move(field, expected, tolerance):
+    assert _within(getattr(_reference("atm"), field), expected, tolerance)
+
+
+@pytest.mark.parametrize("name", list(SCIPY_REFERENCE))
+@pytest.mark.parametrize("field", [f.name for f in fields(BlackScholesBatch)])
+def test_scalar_matches_scipy_reference(name, field):
+    expected = SCIPY_REFERENCE[name][_FIELD_INDEX[field]]
+    result = black_scholes(*_inputs(name))
+    assert abs(getattr(result, field) - expected) < SCIPY_TOLERANCE
+
+
+@pytest.mark.parametrize("name", list(SCIPY_REFERENCE))
+@pytest.mark.parametrize("field", [f.name for f in fields(BlackScholesBatch)])
+def test_reference_batch_matches_scipy_reference(name, field):
+    expected = SCIPY_REFERENCE[name][_FIELD_INDEX[field]]
+    assert abs(getattr(_reference(name), field) - expected) < SCIPY_TOLERANCE
+
+
+# Deep in-the-money puts (K=100, T=1, r=5%, σ=20%) from scipy.stats.norm:
+# spot -> (put, delta_put, theta_put, rho_put). Prices here are far below
+# SCIPY_TOLERANCE, so they are compared relatively.
+DEEP_ITM_PUTS = {
+    350.0: (
+        1.9559312935446849e-10, -1.8727008293303037e-11,
+        -4.092508312207701e-09, -6.750046032010531e-09,
+    ),
+    397.5: (
+        2.262572895271625e-12, -2.081955217349818e-13,
+        -5.6851028037405574e-11, -8.502029278492689e-11,
+    ),
+}
+
+
+@pytest.mark.parametrize("backend", [
+    pytest.param(black_scholes, id="scalar"),
+    pytest.param(lambda *args: _black_scholes_batch(*_as_columns(*args)), id="numpy"),
+    pytest.param(
+        lambda *args: _black_scholes_cython(*_as_columns(*args)), id="cython",
+        marks=pytest.mark.skipif(_bs_cy is None, reason="_bs_cy not built"),
+    ),
+])
+@pytest.mark.parametrize("spot", list(DEEP_ITM_PUTS))
+def test_deep_itm_put_keeps_relative_precision(backend, spot):
+    result = backend(spot, 100.0, 1.0, 0.05, 0.2)
+    for field, expected in zip(("put_price", "delta_put", "theta_put", "rho_put"), DEEP_ITM_PUTS[spot]):
+        np.testing.assert_allclose(getattr(result, field), expected, rtol=1e-9, err_msg=field)
+
+
+@pytest.mark.parametrize("attr", ["S", "d1", "call_price"])
+def test_memoised_scalar_result_is_immutable(attr):
+    result = black_scholes(*_inputs("atm"))
+    with pytest.raises(AttributeError):
+        setattr(result, attr, 50.0)
+    assert black_scholes(*_inputs("atm")).put_price == pytest.approx(
+        SCIPY_REFERENCE["atm"][_FIELD_INDEX["put_price"]], abs=SCIPY_TOLERANCE
+    )
+
+
+@pytest.mark.parametrize("field", [f.name for f in fields(BlackScholesBatch)])
+def test_reference_batch_is_read_only(field):
+    with pytest.raises(ValueError):
+        getattr(_reference_batch(), field)[0] = 0.0
+
+
+def test_scenario_columns_are_read_only():
+    for col in (_S, _K, _T, _r, _sig):
+        with pytest.raises(ValueError):
+            col[0] = 0.0
+
+
+@pytest.mark.parametrize("spot", [np.array(100.0), np.float64(100.0), 100])
+def test_scalar_dispatch_accepts_zero_dim_inputs(spot):
+    result = black_scholes(spot, 100, 1, 0.05, 0.2)
+    assert isinstance(result, BlackScholesResult)
+    assert abs(result.call_price - SCIPY_REFERENCE["atm"][_FIELD_INDEX["call_price"]]) < SCIPY_TOLERANCE
+
+
+@pytest.mark.parametrize("inputs", [
+    (100, 100, 1.0, 0.05, 0.0),
+    (100, 100, 0.0, 0.05, 0.2),
+    (0, 100, 1.0, 0.05, 0.2),
+    (100, 0, 1.0, 0.05, 0.2),
+    (-100, 100, 1.0, 0.05, 0.2),
+    (np.nan, 100, 1.0, 0.05, 0.2),
+], ids=["zero_sigma", "zero_T", "zero_S", "zero_K", "negative_S", "nan_S"])
+@pytest.mark.parametrize("as_array", [False, True], ids=["scalar", "array"])
+def test_degenerate_inputs_raise(inputs, as_array):
+    if as_array:
+        # One bad row among valid ones must still reject the whole batch
+        inputs = [np.array([valid, x]) for valid, x in zip(_inputs("atm"), inputs)]
+    with pytest.raises(ValueError):
+        black_scholes(*inputs)
+
+
+_BATCH_BACKENDS = [
+    pytest.param(_black_scholes_batch, id="numpy"),
+    pytest.param(
+        _black_scholes_cython, id="cython",
+        marks=pytest.mark.skipif(_bs_cy is None, reason="_bs_cy not built"),
+    ),
+]
+
+
+@pytest.mark.parametrize("backend", _BATCH_BACKENDS)
+@pytest.mark.parametrize("name", list(_SCENARIO_INDEX))
+def test_batch_backend_matches_scalar(backend, name):
+    batch = backend(*_as_columns(*_inputs(name)))
+    scalar = black_scholes(*_inputs(name))
+    for f in fields(BlackScholesBatch):
+        np.testing.assert_allclose(
+            getattr(batch, f.name)[0], getattr(scalar, f.name), rtol=1e-12, atol=1e-12,
+            err_msg=f.name,
+        )
+
+
+@pytest.mark.skipif(_bs_cy is None, reason="_bs_cy not built")
+@pytest.mark.parametrize("short", [1, 5], ids=["input", "output"])
+def test_cython_kernel_rejects_mismatched_lengths(short):
+    columns = [np.ones(4) for _ in range(17)]
+    columns[short] = np.ones(1)
+    with pytest.raises(ValueError):
+        _bs_cy.bs_batch(*columns)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.05, 50_000_000_000_000_000),
+    (1.0, 10**18),
+    (-0.35, -350_000_000_000_000_000),
+    (10.450583572185565, 10_450_583_572_185_565_000),
+])
+def test_to_wad_scales_decimal_digits(value, expected):
+    assert to_wad(value) == expected
+
+
+@pytest.mark.parametrize("column", [
+    _T, _r, _sig,
+    np.array([9.2233720368, 0.123456789123456789, -1.5, 0.0]),
+], ids=["T", "r", "sigma", "awkward"])
+def test_to_wad_i64_arr_matches_to_wad(column):
+    assert to_wad_i64_arr(column).tolist() == [to_wad(v) for v in column]
+
+
+def test_to_wad_i64_arr_overflow_boundary():
+    below = np.nextafter(_I64_WAD_LIMIT, 0.0)
+    assert to_wad_i64_arr([below, -below]).tolist() == [to_wad(below), to_wad(-below)]
+    with pytest.raises(OverflowError):
+        to_wad_i64_arr([_I64_WAD_LIMIT])
+    with pytest.raises(OverflowError):
+        to_wad_i64_arr([-_I64_WAD_LIMIT])
+
+
+@pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+def test_to_wad_i64_arr_rejects_non_finite(value):
+    with pytest.raises(ValueError):
+        to_wad_i64_arr([0.05, value])
+
+
+@pytest.mark.skipif(numba is None, reason="numba not installed")
+def test_numba_kernel_matches_reference():
+    batch = black_scholes_numba(_S, _K, _T, _r, _sig)
+    
+    # A&S 7.1.26 is accurate to ~1.5e-7 in N(x); price-scale fields carry
+    # that error multiplied by S and K (<= 200 here)
+    for f in fields(BlackScholesBatch):
+        np.testing.assert_allclose(
+            getattr(batch, f.name), getattr(_reference_batch(), f.name), rtol=0, atol=2e-4,
+            err_msg=f.name,
+        )
+
+
+@pytest.mark.skipif(numba is None, reason="numba not installed")
+def test_numba_kernel_accepts_2d_inputs():
+    S = np.array([[80.0, 100.0], [120.0, 200.0]])
+    batch = black_scholes_numba(S, 100, 1.0, 0.05, 0.2)
+    reference = black_scholes(S, 100, 1.0, 0.05, 0.2)
+    for f in fields(BlackScholesBatch):
+        assert getattr(batch, f.name).shape == S.shape
+        np.testing.assert_allclose(
+            getattr(batch, f.name), getattr(reference, f.name), rtol=0, atol=2e-4,
+            err_msg=f.name,
+        )